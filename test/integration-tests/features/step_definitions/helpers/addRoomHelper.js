@@ -1,58 +1,85 @@
 const { By, until } = require('selenium-webdriver');
 
 // Helper function to wait until an element is present before interacting with it
-async function waitForElement(driver, locator, timeout = 10000) {
+async function waitForElement(driver, locator, timeout = 5000) {
     return driver.wait(until.elementLocated(locator), timeout);
 }
 
 async function openAddRoomPage(driver) {
-    const addLink = await driver.wait(until.elementIsVisible(driver.findElement(By.linkText("Book"))), 20000);
-    await driver.wait(until.elementIsEnabled(addLink), 10000);
+    const addLink = await waitForElement(driver, By.id("nav-add"), 20000);
+    await driver.wait(until.elementIsVisible(addLink), 20000);
+    await driver.wait(until.elementIsEnabled(addLink), 5000);
     await addLink.click();
 }
 
+const typeInto = async (element, value) => {
+    await element.clear();
+    await element.sendKeys(value);
+};
+
+// Locator and action for each form field, keyed by the field names used in the step definitions
+const FORM_FIELDS = {
+    room_number: { locator: By.name("roomNumber"), action: typeInto },
+    floor_number: { locator: By.name("floorNumber"), action: typeInto },
+    good_view: { locator: By.name("hasView"), action: (element, value) => element.sendKeys(value) }, // Simulate selecting the dropdown value
+    submit: { locator: By.id("room-form-submit"), action: (element) => element.click() },
+};
+
 async function fillAddRoomForm(driver, field, value = null) {
-    if (field === "room_number") {
-        const roomNumberField = await waitForElement(driver, By.name("roomNumber"));
-        await roomNumberField.clear();
-        await roomNumberField.sendKeys(value);
-    } else if (field === "floor_number") {
-        const floorNumberField = await waitForElement(driver, By.name("floorNumber"));
-        await floorNumberField.clear();
-        await floorNumberField.sendKeys(value);
-    } else if (field === "good_view") {
-        const goodViewDropdown = await waitForElement(driver, By.name("hasView"));
-        await goodViewDropdown.sendKeys(value); // Simulate selecting the dropdown value
-    } else if (field === "submit") {
-        const submitButton = await waitForElement(driver, By.css('button[type="submit"]'));
-        await submitButton.click();
+    const formField = FORM_FIELDS[field];
+    if (!formField) {
+        throw new Error(`Unknown add room form field: ${field}`);
     }
+    const element = await waitForElement(driver, formField.locator);
+    await formField.action(element, value);
+}
+
+// Fill in and submit the whole form with a single script call instead of one command per field
+async function fillAddRoomFormBulk(driver, roomNumber, floorNumber, hasView) {
+    await waitForElement(driver, By.id("room-form-submit"));
+    await driver.executeScript(`
+        const form = document.forms["add-room"];
+        form.elements["roomNumber"].value = arguments[0];
+        form.elements["floorNumber"].value = arguments[1];
+        const option = Array.from(form.elements["hasView"].options).find(o => o.text === arguments[2]);
+        if (!option) {
+            throw new Error("Unknown Good View option: " + arguments[2]);
+        }
+        form.elements["hasView"].value = option.value;
+        form.requestSubmit();
+    `, roomNumber, floorNumber, hasView);
+}
+
+// Read the state of the add room form in a single script call once the page has loaded
+async function probeAddRoomForm(driver) {
+    await driver.wait(until.titleIs("Add new room"), 20000);
+    return driver.executeScript(`
+        const submitButton = document.getElementById("room-form-submit");
+        return {
+            roomNumber: document.getElementsByName("roomNumber").length > 0,
+            floorNumber: document.getElementsByName("floorNumber").length > 0,
+            hasView: document.getElementsByName("hasView").length > 0,
+            submitLabel: submitButton ? submitButton.innerText.trim() : null,
+        };
+    `);
 }
 
 async function verifyAddRoomFormFields(driver) {
-    // Check if the "Room number" field is present
-    const roomNumberField = await driver.wait(until.elementLocated(By.name("roomNumber")), 20000);
-    if (!roomNumberField) {
+    const form = await probeAddRoomForm(driver);
+    if (!form.roomNumber) {
         throw new Error("Room number field is missing");
     }
-
-    // Check if the "Floor number" field is present
-    const floorNumberField = await driver.wait(until.elementLocated(By.name("floorNumber")), 20000);
-    if (!floorNumberField) {
+    if (!form.floorNumber) {
         throw new Error("Floor number field is missing");
     }
-
-    // Check if the "Good View" dropdown is present
-    const goodViewDropdown = await driver.wait(until.elementLocated(By.name("hasView")), 20000);
-    if (!goodViewDropdown) {
+    if (!form.hasView) {
         throw new Error("Good View dropdown is missing");
     }
-
 }
 
 async function verifyAddRoomSuccess(driver, redirect = null) {
     if (redirect) {
-        await driver.wait(until.titleIs("Room List"), 10000);
+        await driver.wait(until.titleIs("Room List"), 5000);
     } else {
         const successMessage = await waitForElement(driver, By.css(".results p"));
         const successText = await successMessage.getText();
@@ -63,21 +90,23 @@ async function verifyAddRoomSuccess(driver, redirect = null) {
 }
 
 async function verifySubmitButton(driver, expectedLabel) {
-    // Locate the submit button using its type attribute
-    const submitButton = await driver.wait(until.elementLocated(By.css('button[type="submit"]')), 20000);
-    const buttonText = await submitButton.getText();
+    const { submitLabel } = await probeAddRoomForm(driver);
+    if (submitLabel === null) {
+        throw new Error("Submit button is missing");
+    }
 
     // Check if the button text matches the expected label
-    if (buttonText !== expectedLabel) {
-        throw new Error(`Expected button text to be '${expectedLabel}', but got '${buttonText}'`);
+    if (submitLabel !== expectedLabel) {
+        throw new Error(`Expected button text to be '${expectedLabel}', but got '${submitLabel}'`);
     }
 
-    console.log(`Submit button with label '${buttonText}' is present.`);
+    console.log(`Submit button with label '${submitLabel}' is present.`);
 }
 
 module.exports = {
     openAddRoomPage,
     fillAddRoomForm,
+    fillAddRoomFormBulk,
     verifyAddRoomSuccess,
     verifyAddRoomFormFields,
     verifySubmitButton,
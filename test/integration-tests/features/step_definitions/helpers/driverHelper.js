@@ -0,0 +1,30 @@
+const chrome = require('selenium-webdriver/chrome');
+
+// Chrome options shared by local, Grid and pre-started Grid sessions
+function buildChromeOptions() {
+    const options = new chrome.Options();
+    options.addArguments(
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--window-size=1920,1080', // Full HD resolution
+        '--blink-settings=imagesEnabled=false'
+    );
+
+    // Images play no part in the assertions, so don't spend page load time fetching them.
+    // Stylesheets stay enabled because Bootstrap's CSS decides which navbar elements are displayed.
+    options.setUserPreferences({
+        'profile.managed_default_content_settings.images': 2,
+    });
+
+    // Headless skips layout and paint work nobody looks at; set HEADED=1 to watch the browser
+    if (process.env.HEADED !== '1') {
+        options.addArguments('--headless=new');
+    }
+
+    return options;
+}
+
+module.exports = {
+    buildChromeOptions,
+};
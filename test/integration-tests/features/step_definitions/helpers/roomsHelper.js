@@ -1,43 +1,85 @@
 const { By, until } = require('selenium-webdriver');
 
+const ROOMS_ALERT_PATTERN = /Rooms stored in database: \d+/;
+
+// Resolves with the rooms alert text as soon as it is rendered, using a MutationObserver instead of polling
+const WAIT_FOR_ROOMS_ALERT_SCRIPT = `
+    const done = arguments[arguments.length - 1];
+    const alertText = () => {
+        const alert = document.getElementById("rooms-alert");
+        return alert && alert.innerText.trim();
+    };
+    if (alertText()) {
+        return done(alertText());
+    }
+    let timer;
+    const observer = new MutationObserver(() => {
+        if (alertText()) {
+            observer.disconnect();
+            clearTimeout(timer);
+            done(alertText());
+        }
+    });
+    observer.observe(document.documentElement, { childList: true, subtree: true, characterData: true });
+    timer = setTimeout(() => {
+        observer.disconnect();
+        done(null);
+    }, arguments[0]);
+`;
+
+// Evaluate a JavaScript expression that builds an array from the page, in a single WebDriver call
+async function readPageList(driver, expression) {
+    const result = await driver.executeScript(`return (${expression});`);
+    if (!Array.isArray(result)) {
+        throw new Error(`Expected the page script to return an array, but got: ${JSON.stringify(result)}`);
+    }
+    return result;
+}
+
 async function openRoomsPage(driver) {
-    const roomsLink = await driver.wait(until.elementIsVisible(driver.findElement(By.linkText("Rooms"))), 20000);
-    await driver.wait(until.elementIsEnabled(roomsLink), 10000);
+    const roomsLink = await driver.wait(until.elementLocated(By.id("nav-rooms")), 20000);
+    await driver.wait(until.elementIsVisible(roomsLink), 20000);
+    await driver.wait(until.elementIsEnabled(roomsLink), 5000);
     await roomsLink.click();
 }
 
 async function verifyRoomList(driver, element, value = null) {
     if (element === "title") {
-        await driver.wait(until.titleIs(value), 10000);
+        await driver.wait(until.titleIs(value), 5000);
     } else if (element === "room_table") {
-        await driver.wait(until.elementLocated(By.css("table")), 10000);
+        await driver.wait(until.elementLocated(By.css("table")), 5000);
     }
 }
 
 async function verifyRoomDetails(driver, roomNumber, floorNumber, viewStatus) {
     await driver.sleep(3000);  // Wait for 3 seconds before locating elements
-    const rows = await driver.wait(until.elementsLocated(By.css("tbody tr")), 20000);
-    for (let row of rows) {
-        const rowText = await row.getText();
-        if (rowText.includes(roomNumber)) {
-            if (!rowText.includes(floorNumber)) {
-                throw new Error(`Expected floor number ${floorNumber} not found`);
-            }
+    await driver.wait(until.elementsLocated(By.css("tbody tr")), 20000);
+    // Snapshot the whole table in one call rather than reading each row over WebDriver
+    const rows = await readPageList(driver, `
+        Array.from(document.querySelectorAll("tbody tr"))
+            .map(row => ({ text: row.innerText, html: row.innerHTML }))
+    `);
+    const row = rows.find(r => r.text.includes(roomNumber));
+    if (!row) {
+        throw new Error(`Expected room number ${roomNumber} not found in the room list`);
+    }
 
-            const rowHTML = await row.getAttribute("innerHTML");
-            if (viewStatus === "Yes" && !rowHTML.includes("bg-success")) {
-                throw new Error(`Expected view status 'Yes', but found 'No'`);
-            } else if (viewStatus === "No" && !rowHTML.includes("bg-danger")) {
-                throw new Error(`Expected view status 'No', but found 'Yes'`);
-            }
-            break;
-        }
+    if (!row.text.includes(floorNumber)) {
+        throw new Error(`Expected floor number ${floorNumber} not found`);
+    }
+
+    if (viewStatus === "Yes" && !row.html.includes("bg-success")) {
+        throw new Error(`Expected view status 'Yes', but found 'No'`);
+    } else if (viewStatus === "No" && !row.html.includes("bg-danger")) {
+        throw new Error(`Expected view status 'No', but found 'Yes'`);
     }
 }
 
 async function verifyTableColumns(driver) {
-    const headers = await driver.wait(until.elementsLocated(By.css("table thead th")), 10000);
-    const headerTexts = await Promise.all(headers.map(header => header.getText()));
+    await driver.wait(until.elementsLocated(By.css("table thead th")), 5000);
+    const headerTexts = await readPageList(driver, `
+        Array.from(document.querySelectorAll("table thead th")).map(header => header.innerText.trim())
+    `);
 
     if (!headerTexts.includes("Room Number")) {
         throw new Error("Expected 'Room Number' column in table headers");
@@ -51,11 +93,12 @@ async function verifyTableColumns(driver) {
 }
 
 async function verifyRoomsStoredAlert(driver) {
-    const alert = await driver.wait(until.elementLocated(By.css(".alert-info")), 10000);
-    const alertText = await alert.getText();
-    const pattern = /Rooms stored in database: \d+/;
-    if (!pattern.test(alertText)) {
-        throw new Error(`Expected an alert matching '${pattern}', but got: ${alertText}`);
+    const alertText = await driver.executeAsyncScript(WAIT_FOR_ROOMS_ALERT_SCRIPT, 5000);
+    if (!alertText) {
+        throw new Error("Rooms alert did not appear");
+    }
+    if (!ROOMS_ALERT_PATTERN.test(alertText)) {
+        throw new Error(`Expected an alert matching '${ROOMS_ALERT_PATTERN}', but got: ${alertText}`);
     }
 }
 
@@ -1,11 +1,14 @@
-const { setDefaultTimeout, Given, When, Then, After } = require('@cucumber/cucumber');
-const { Builder, By, until } = require('selenium-webdriver');
-const chrome = require('selenium-webdriver/chrome');
-const { ServiceBuilder } = require('selenium-webdriver/chrome');
+const { setDefaultTimeout, Given, When, Then, Before, BeforeAll, AfterAll } = require('@cucumber/cucumber');
+const { Builder, By, until, Session, WebDriver } = require('selenium-webdriver');
+const { Executor, HttpClient } = require('selenium-webdriver/http');
+const http = require('http');
+const https = require('https');
+const { buildChromeOptions } = require('./helpers/driverHelper');
 const { openHomepage, verifyHomepageElements } = require('./helpers/homepageHelper');
 const {
   openAddRoomPage,
   fillAddRoomForm,
+  fillAddRoomFormBulk,
   verifyAddRoomSuccess,
   verifyAddRoomFormFields,
   verifySubmitButton
@@ -19,33 +22,50 @@ const {
 } = require('./helpers/roomsHelper');
 
 let driver;
+let attachedSession = false;
+
+// Maps the field labels used in the feature file to the form fields understood by fillAddRoomForm
+const FORM_FIELD_NAMES = {
+  'Room number': 'room_number',
+  'Floor number': 'floor_number',
+};
 
 setDefaultTimeout(120 * 1000); // needed for the time it takes to spin up the remote web driver if used
 
 // Function to build and return a WebDriver instance
 const buildDriver = async () => {
   const gridUrl = process.env.GRID_URL || null;
+  // Set by cucumber-js when running with --parallel, one value per worker process
+  const workerId = process.env.CUCUMBER_WORKER_ID || '0';
+  const options = buildChromeOptions();
 
   if (gridUrl) {
-    console.log(`Using Selenium Grid at: ${gridUrl}`);
-    driver = await new Builder()
-      .usingServer(gridUrl) // Use the Selenium Grid URL here
-      .forBrowser('chrome')
-      .build();
+    console.log(`Worker ${workerId}: using Selenium Grid at: ${gridUrl}`);
+    // Keep connections to the Grid open so each command does not pay for a new TCP/TLS handshake
+    const agentOptions = { keepAlive: true, maxSockets: 10 };
+    const httpAgent = gridUrl.startsWith('https:') ? new https.Agent(agentOptions) : new http.Agent(agentOptions);
+
+    // Sessions pre-started by scripts/grid-sessions.js, one per worker, skip the browser startup
+    const sessionIds = (process.env.GRID_SESSION_IDS || '').split(',').filter(Boolean);
+    const sessionId = sessionIds[parseInt(workerId, 10)];
+
+    if (sessionId) {
+      console.log(`Worker ${workerId}: attaching to existing Grid session ${sessionId}`);
+      // This is a plain WebDriver without the Chrome extensions (e.g. sendAndGetDevToolsCommand),
+      // so helpers must only rely on standard WebDriver commands such as executeScript.
+      const executor = new Executor(new HttpClient(gridUrl, httpAgent));
+      driver = new WebDriver(new Session(sessionId, {}), executor);
+      attachedSession = true;
+    } else {
+      driver = await new Builder()
+        .usingServer(gridUrl) // Use the Selenium Grid URL here
+        .usingHttpAgent(httpAgent)
+        .forBrowser('chrome')
+        .setChromeOptions(options)
+        .build();
+    }
   } else {
     // If no GRID_URL is set, run the browser locally
-    let options = new chrome.Options();
-    options.addArguments(
-      '--no-sandbox',
-      '--disable-dev-shm-usage',
-      '--disable-gpu'
-    );
-
-    if (process.env.CI) {
-      console.log('Running in CI, enabling headless mode for Chrome');
-      options.addArguments('--headless');
-    }
-
     driver = await new Builder()
       .forBrowser('chrome')
       .setChromeOptions(options)
@@ -53,13 +73,27 @@ const buildDriver = async () => {
   }
 
   // Common settings for the driver
-  await driver.manage().setTimeouts({ implicit: 10000 });
-  await driver.manage().window().setRect({ width: 1920, height: 1080 }); // Full HD resolution
+  // No implicit wait: helpers use explicit waits, and mixing both compounds timeouts.
+  // Page loads and scripts fail fast so a degraded app does not stall the whole run.
+  await driver.manage().setTimeouts({ implicit: 0, pageLoad: 15000, script: 15000 });
 };
 
+// Each parallel worker starts its own browser once and reuses it for all the scenarios it runs
+BeforeAll(async function () {
+  await buildDriver();
+});
+
+// Reset browser state between scenarios since the driver is shared across them
+Before(async function () {
+  await driver.manage().deleteAllCookies();
+  // Storage is not accessible before the first navigation (about:blank), so ignore that case
+  await driver.executeScript(
+    'try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}'
+  );
+});
+
 // Step Definitions
 Given('I am on the homepage', async function () {
-  await buildDriver(); // Create WebDriver instance
   const baseUrl = process.env.BASE_URL || 'http://localhost:8081';
   await openHomepage(driver, baseUrl); // Use helper function to open the homepage
 });
@@ -86,17 +120,13 @@ When('I click on {string} in the navbar', async function (linkText) {
       // Wait for page to be ready
       await driver.sleep(1000);
       
-      // Re-find the navbar link to avoid stale element reference
-      const navbarLinkLocator = By.linkText(linkText);
-      await driver.wait(
-        until.elementLocated(navbarLinkLocator),
+      // Re-find the navbar link each attempt to avoid stale element reference
+      const navbarLink = await driver.wait(
+        until.elementLocated(By.id(`nav-${linkText.toLowerCase()}`)),
         10000,
         `Navbar link "${linkText}" not found`
       );
 
-      // Find the element fresh each time
-      const navbarLink = await driver.findElement(navbarLinkLocator);
-      
       // Click the navbar link
       await navbarLink.click();
 
@@ -127,13 +157,11 @@ Then('the table should contain columns for {string}, {string}, and {string}', as
 });
 
 When('I enter {string} in the {string} field', async function (value, fieldName) {
-  if (fieldName === 'Room number') {
-    await fillAddRoomForm(driver, 'room_number', value);
-  } else if (fieldName === 'Floor number') {
-    await fillAddRoomForm(driver, 'floor_number', value);
-  } else {
+  const field = FORM_FIELD_NAMES[fieldName];
+  if (!field) {
     throw new Error(`Unsupported field name: ${fieldName}`);
   }
+  await fillAddRoomForm(driver, field, value);
 });
 
 When('I select {string} from the "Good View" dropdown', async function (value) {
@@ -144,6 +172,10 @@ When('I click the "Add room" button', async function () {
   await fillAddRoomForm(driver, 'submit');
 });
 
+When('I submit the add-room form with room number {string}, floor {string} and Good View {string}', async function (roomNumber, floorNumber, hasView) {
+  await fillAddRoomFormBulk(driver, roomNumber, floorNumber, hasView);
+});
+
 Then('the new room should be added successfully', async function () {
   await verifyAddRoomSuccess(driver);
 });
@@ -165,8 +197,9 @@ Then('I should see a submit button labeled {string}', { timeout: 20000 }, async
 });
 
 // Tear Down
-After(async function () {
-  if (driver) {
+AfterAll(async function () {
+  // Pre-started sessions are shared across runs and are stopped by scripts/grid-sessions.js
+  if (driver && !attachedSession) {
     await driver.quit();
   }
 });
@@ -0,0 +1,57 @@
+// scripts/grid-sessions.js
+// Pre-starts browser sessions on a Selenium Grid so the integration test workers can attach to them
+// instead of each starting a new browser. Start one session per Cucumber worker (see --parallel):
+//   export GRID_SESSION_IDS=$(node test/integration-tests/scripts/grid-sessions.js start 6)
+// and stop them once the tests are done:
+//   node test/integration-tests/scripts/grid-sessions.js stop
+// Sessions left idle longer than the Grid's session timeout are reclaimed, so start them right before the tests.
+const { Builder, Session, WebDriver } = require('selenium-webdriver');
+const { Executor, HttpClient } = require('selenium-webdriver/http');
+const { buildChromeOptions } = require('../features/step_definitions/helpers/driverHelper');
+
+const startSessions = async (gridUrl, count) => {
+  const results = await Promise.allSettled(
+    Array.from({ length: count }, () => new Builder().usingServer(gridUrl).forBrowser('chrome').setChromeOptions(buildChromeOptions()).build())
+  );
+  const drivers = results.filter((result) => result.status === 'fulfilled').map((result) => result.value);
+  const failed = results.find((result) => result.status === 'rejected');
+  if (failed) {
+    // Don't leave the sessions that did start running on the Grid
+    await Promise.allSettled(drivers.map((driver) => driver.quit()));
+    throw failed.reason;
+  }
+  const sessions = await Promise.all(drivers.map((driver) => driver.getSession()));
+  console.log(sessions.map((session) => session.getId()).join(','));
+};
+
+const stopSessions = async (gridUrl, sessionIds) => {
+  const executor = new Executor(new HttpClient(gridUrl));
+  await Promise.all(
+    sessionIds.map((sessionId) => new WebDriver(new Session(sessionId, {}), executor).quit())
+  );
+  console.error(`Stopped ${sessionIds.length} Grid session(s)`);
+};
+
+(async () => {
+  try {
+    const gridUrl = process.env.GRID_URL;
+    if (!gridUrl) {
+      throw new Error('GRID_URL must be set');
+    }
+
+    const [action, count] = process.argv.slice(2);
+    if (action === 'start') {
+      await startSessions(gridUrl, parseInt(count || '1', 10));
+      // The sessions must stay open, so exit without quitting the drivers
+      process.exit(0);
+    } else if (action === 'stop') {
+      const sessionIds = (process.env.GRID_SESSION_IDS || '').split(',').filter(Boolean);
+      await stopSessions(gridUrl, sessionIds);
+    } else {
+      throw new Error(`Unknown action '${action}', expected 'start' or 'stop'`);
+    }
+  } catch (err) {
+    console.error('Error managing Grid sessions:', err);
+    process.exit(1);
+  }
+})();
@@ -19,5 +19,6 @@ describe("POST /add", () => {
 
     expect(res.status).toBe(200);
     expect(res.text).toContain("Room number 101 added");
+    expect(res.text).toContain('id="room-form-submit"');
   });
 });
@@ -19,5 +19,6 @@ describe("GET /rooms", () => {
     expect(res.status).toBe(200);
     expect(res.text).toContain("Room List");
     expect(res.text).toContain("101");
+    expect(res.text).toContain('id="rooms-alert"');
   });
 });